@@ -5,30 +5,34 @@ Configuration helpers for the Hyperliquid MCP trader.
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 from typing import Final, Optional
 
+_ENV_FILE: Final[Path] = Path(__file__).resolve().parent.parent / ".env"
+# KEY=value lines; inline "# comments" and surrounding blanks are dropped.
+_ENV_LINE_RE = re.compile(
+    rb"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*([^#\n]*?)[ \t\r]*(?:#[^\n]*)?$",
+    re.MULTILINE,
+)
+
 
 def _load_env_file() -> None:
     """
     Lightweight .env loader to improve local DX without extra dependency.
     Only fills keys that are not already present in the environment.
     """
-    project_root = Path(__file__).resolve().parent.parent
-    env_file = project_root / ".env"
-    if not env_file.exists():
+    try:
+        data = _ENV_FILE.read_bytes()
+    except OSError:
         return
 
-    for line in env_file.read_text(encoding="utf-8").splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or "=" not in stripped:
+    for raw_key, raw_value in _ENV_LINE_RE.findall(data):
+        if not raw_value:
             continue
-        key, value = stripped.split("=", 1)
-        clean_key = key.strip()
-        clean_value = _clean_env_value(value)
-
-        if clean_key and clean_value and clean_key not in os.environ:
-            os.environ[clean_key] = clean_value
+        key = raw_key.decode("ascii")
+        if key not in os.environ:
+            os.environ[key] = raw_value.decode("utf-8")
 
 
 def _clean_env_value(raw: Optional[str]) -> Optional[str]:
@@ -42,10 +46,13 @@ def _clean_env_value(raw: Optional[str]) -> Optional[str]:
 
 _load_env_file()
 
+# Read the environment once; every setting below indexes into this copy.
+_snapshot: Final[dict[str, str]] = dict(os.environ)
+
 
 def _require_env(key: str) -> str:
     try:
-        value = os.environ[key]
+        value = _snapshot[key]
     except KeyError as exc:  # noqa: B904
         raise RuntimeError(
             f"Missing required environment variable '{key}'. "
@@ -60,10 +67,10 @@ def _require_env(key: str) -> str:
 
 ACCOUNT_ADDRESS: Final[str] = _require_env("HL_ACCOUNT_ADDRESS")
 SECRET_KEY: Final[str] = _require_env("HL_SECRET_KEY")
-_network_raw = _clean_env_value(os.getenv("HL_NETWORK"))
+_network_raw = _clean_env_value(_snapshot.get("HL_NETWORK"))
 NETWORK: Final[str] = (_network_raw or "mainnet").lower()
-API_BASE_URL: Final[str | None] = _clean_env_value(os.getenv("HL_API_BASE_URL"))
-_skip_ws_raw = _clean_env_value(os.getenv("HL_SKIP_WS"))
+API_BASE_URL: Final[str | None] = _clean_env_value(_snapshot.get("HL_API_BASE_URL"))
+_skip_ws_raw = _clean_env_value(_snapshot.get("HL_SKIP_WS"))
 SKIP_WEBSOCKET: Final[bool] = (_skip_ws_raw or "false").lower() in {
     "1",
     "true",
@@ -71,7 +78,7 @@ SKIP_WEBSOCKET: Final[bool] = (_skip_ws_raw or "false").lower() in {
 }
 
 # Optional HTTP guard: require MCP requests to send a specific header/value pair.
-_header_value_raw = _clean_env_value(os.getenv("MCP_AUTH_HEADER_VALUE"))
+_header_value_raw = _clean_env_value(_snapshot.get("MCP_AUTH_HEADER_VALUE"))
 REQUEST_HEADER_VALUE: Final[str | None] = _header_value_raw
-_header_name_raw = _clean_env_value(os.getenv("MCP_AUTH_HEADER_NAME"))
+_header_name_raw = _clean_env_value(_snapshot.get("MCP_AUTH_HEADER_NAME"))
 REQUEST_HEADER_NAME: Final[str] = _header_name_raw or "Authorization"
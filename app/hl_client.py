@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import time
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
@@ -22,6 +24,52 @@ TIF_ALIASES = {
     "IOC": "Ioc",
     "ALO": "Alo",
 }
+_TIF_ERR_MSG = "Unsupported tif '%s'. Supported values: " + ", ".join(TIF_ALIASES)
+
+# Seconds a fetched mids map stays fresh; collapses bursts of tool calls
+# (e.g. ensure_symbol_exists before every order) into one network fetch.
+MIDS_TTL = 1.5
+# Seconds an {oid -> coin} open-order index stays fresh for back-to-back cancels.
+OPEN_ORDERS_TTL = 0.5
+
+# Keys probed, in order, when the SDK returns a price wrapped in a dict.
+_PRICE_KEYS = ("markPrice", "mark_price", "price", "px")
+# Fields used to match / price entries in older meta() trees.
+_NAME_FIELDS = ("symbol", "coin", "name", "ticker")
+_META_PRICE_KEYS = ("markPx", "mark_price", "markPrice", "px", "price")
+# user_state() keys that may hold positions, in priority order across SDK versions.
+_POSITION_KEYS = ("assetPositions", "perpPositions", "assetPositionsPerps", "spotPositions")
+# user_state() fields surfaced by get_balances.
+_BALANCE_KEYS = (
+    "balances",
+    "marginSummary",
+    "crossMarginSummary",
+    "crossMaintenanceMarginUsed",
+    "withdrawable",
+    "time",
+)
+
+_SIDES = frozenset({"buy", "sell"})
+
+# (fetched_at, mids, search_index, symbol_set): search_index holds
+# (lower_symbol, symbol, price) rows for find_symbols; symbol_set backs
+# ensure_symbol_exists.
+_MidsCache = Tuple[float, Dict[str, float], Tuple[Tuple[str, str, float], ...], frozenset[str]]
+
+
+def _norm_symbol(symbol: str) -> str:
+    """Strip and uppercase a symbol, skipping the copy when already uppercase."""
+    s = symbol.strip()
+    return s if s.isupper() else s.upper()
+
+
+@lru_cache(maxsize=16)
+def _normalize_tif(tif: str) -> str:
+    """Map a user TIF (e.g. 'gtc') to its wire value; memoized per raw input."""
+    tif_wire = TIF_ALIASES.get(tif.strip().upper())
+    if tif_wire is None:
+        raise ValueError(_TIF_ERR_MSG % tif)
+    return tif_wire
 
 
 class HLClient:
@@ -39,16 +87,47 @@ class HLClient:
     # ------------------------------------------------------------------
     def __init__(self) -> None:
         self.base_url = self._resolve_base_url(NETWORK, API_BASE_URL)
-        self.wallet: LocalAccount = Account.from_key(SECRET_KEY)
-
-        # Info: market/account reads. Exchange: trading ops.
-        self.info = Info(base_url=self.base_url, skip_ws=SKIP_WEBSOCKET)
-        self.exchange = Exchange(
+        self._mids_cache: _MidsCache | None = None
+        # (fetched_at, {oid -> coin}) used by cancel_order.
+        self._open_orders_cache: tuple[float, Dict[int, str]] | None = None
+
+    # Info: market/account reads. Exchange: trading ops.
+    # All are built on first use so read-only tools never pay for the
+    # wallet key derivation or Exchange.
+    @cached_property
+    def wallet(self) -> LocalAccount:
+        return Account.from_key(SECRET_KEY)
+
+    @cached_property
+    def info(self) -> Info:
+        return Info(base_url=self.base_url, skip_ws=SKIP_WEBSOCKET)
+
+    @cached_property
+    def exchange(self) -> Exchange:
+        return Exchange(
             wallet=self.wallet,
             base_url=self.base_url,
             account_address=ACCOUNT_ADDRESS,
         )
 
+    # SDK method surface is fixed per process: resolve name variants once.
+    @cached_property
+    def _mark_price_fetchers(self) -> Tuple[Callable[[str], Any], ...]:
+        # older name first, then newer name
+        return tuple(
+            fn
+            for name in ("get_mark_price", "mark_price")
+            if callable(fn := getattr(self.info, name, None))
+        )
+
+    @cached_property
+    def _all_mids_fn(self) -> Optional[Callable[[], Any]]:
+        for name in ("all_mids", "allMids"):
+            f = getattr(self.info, name, None)
+            if callable(f):
+                return f
+        return None
+
     # ------------------------------------------------------------------
     # Market data helpers
     # ------------------------------------------------------------------
@@ -57,13 +136,8 @@ class HLClient:
         Tries multiple SDK methods for compatibility; falls back to mids map.
         Raises AttributeError if no usable source is available.
         """
-        symbol = symbol.strip().upper()
-        fetchers = []
-        if hasattr(self.info, "get_mark_price"):
-            fetchers.append(self.info.get_mark_price)  # older name
-        if hasattr(self.info, "mark_price"):
-            fetchers.append(self.info.mark_price)      # newer name
-
+        symbol = _norm_symbol(symbol)
+        fetchers = self._mark_price_fetchers
         for getter in fetchers:
             try:
                 raw_px = getter(symbol)
@@ -87,14 +161,38 @@ class HLClient:
         )
 
     def _get_all_mids(self) -> Dict[str, float]:
-        """Return a {symbol -> mid price} dict, handling SDK naming."""
-        for name in ("all_mids", "allMids"):
-            f = getattr(self.info, name, None)
-            if callable(f):
-                mids = f() or {}
-                # Normalize keys to uppercase
-                return {str(k).upper(): float(v) for k, v in mids.items()}
-        return {}
+        """Return a {symbol -> mid price} dict, handling SDK naming.
+        Results are cached for MIDS_TTL seconds; callers must not mutate them.
+        """
+        return self._refresh_mids()[1]
+
+    def _get_search_index(self) -> Tuple[Tuple[str, str, float], ...]:
+        """Return cached (lower_symbol, symbol, price) rows for fuzzy search."""
+        return self._refresh_mids()[2]
+
+    def _get_symbol_set(self) -> frozenset[str]:
+        """Return the cached set of known symbols for membership checks."""
+        return self._refresh_mids()[3]
+
+    def _refresh_mids(self) -> _MidsCache:
+        now = time.monotonic()
+        cached = self._mids_cache
+        if cached is not None and now - cached[0] < MIDS_TTL:
+            return cached
+
+        mids: Dict[str, float] = {}
+        f = self._all_mids_fn
+        if f is not None:
+            raw = f() or {}
+            # Normalize keys to uppercase
+            mids = {str(k).upper(): float(v) for k, v in raw.items()}
+        search_index = tuple(
+            (s.lower(), s, px)
+            for s, px in mids.items()
+            if 1 <= len(s) <= 12  # filter noisy tickers
+        )
+        self._mids_cache = (now, mids, search_index, frozenset(mids))
+        return self._mids_cache
 
     def list_symbols(self, limit: Optional[int] = None) -> List[str]:
         """List available trading symbols (from mids)."""
@@ -105,20 +203,20 @@ class HLClient:
         """Fuzzy search symbols containing `query` (case-insensitive).
         Returns list of (symbol, mid_price).
         """
+        if limit <= 0:
+            return []
         q = query.strip().lower()
-        mids = self._get_all_mids()
         out: List[Tuple[str, float]] = []
-        for s, px in mids.items():
-            if q in s.lower():
-                if 1 <= len(s) <= 12:  # filter noisy tickers
-                    out.append((s, float(px)))
-            if len(out) >= limit:
-                break
+        for lower, s, px in self._get_search_index():
+            if q in lower:
+                out.append((s, px))
+                if len(out) >= limit:
+                    break
         return out
 
     def ensure_symbol_exists(self, symbol: str) -> None:
-        symbol = symbol.strip().upper()
-        if symbol not in self._get_all_mids():
+        symbol = _norm_symbol(symbol)
+        if symbol not in self._get_symbol_set():
             raise ValueError(
                 f"Symbol '{symbol}' not found in exchange mids; call list_symbols()/find_symbols() first."
             )
@@ -135,12 +233,10 @@ class HLClient:
         reduce_only: bool = False,
     ) -> Dict[str, Any]:
         """Place a market order. When dry_run=True, returns the would-be payload."""
-        symbol_u = symbol.strip().upper()
+        symbol_u = _norm_symbol(symbol)
         self.ensure_symbol_exists(symbol_u)
 
-        side_norm = side.strip().lower()
-        if side_norm not in {"buy", "sell"}:
-            raise ValueError("side must be 'buy' or 'sell'")
+        side_norm = self._normalize_side(side)
         size = self._to_float(qty, "qty")
         if size <= 0:
             raise ValueError("qty must be greater than 0")
@@ -170,12 +266,10 @@ class HLClient:
         reduce_only: bool = False,
     ) -> Dict[str, Any]:
         """Place a limit order with TIF (GTC/IOC/ALO). When dry_run=True, only returns would-be payload."""
-        symbol_u = symbol.strip().upper()
+        symbol_u = _norm_symbol(symbol)
         self.ensure_symbol_exists(symbol_u)
 
-        side_norm = side.strip().lower()
-        if side_norm not in {"buy", "sell"}:
-            raise ValueError("side must be 'buy' or 'sell'")
+        side_norm = self._normalize_side(side)
 
         size = self._to_float(qty, "qty")
         if size <= 0:
@@ -185,7 +279,7 @@ class HLClient:
         if limit_px <= 0:
             raise ValueError("price must be greater than 0 for limit orders")
 
-        tif_wire = self._normalize_tif(tif)
+        tif_wire = _normalize_tif(tif)
         payload = {
             "name": symbol_u,
             "is_buy": side_norm == "buy",
@@ -232,13 +326,31 @@ class HLClient:
     def cancel_order(self, oid: str | int) -> Dict[str, Any]:
         """Cancel an order by order id (looks up symbol via open orders)."""
         order_id = self._to_int(oid, "order_id")
+        coin: Optional[str] = None
+        cached = self._open_orders_cache
+        if cached is not None and time.monotonic() - cached[0] < OPEN_ORDERS_TTL:
+            coin = cached[1].get(order_id)
+        if coin is None:
+            # Stale or missing entry: refetch once before giving up.
+            coin = self._refresh_open_order_index().get(order_id)
+        if coin is None:
+            raise ValueError(f"Order id {order_id} not found in open orders.")
+        res = self.exchange.cancel(coin, order_id)
+        # Drop only this oid so the rest of a cancel burst still hits the index.
+        cached = self._open_orders_cache
+        if cached is not None:
+            cached[1].pop(order_id, None)
+        return res
+
+    def _refresh_open_order_index(self) -> Dict[int, str]:
+        index: Dict[int, str] = {}
         for order in self.get_open_orders():
             try:
-                if int(order.get("oid")) == order_id:
-                    return self.exchange.cancel(order["coin"], order_id)
+                index[int(order.get("oid"))] = order["coin"]
             except Exception:
                 continue
-        raise ValueError(f"Order id {order_id} not found in open orders.")
+        self._open_orders_cache = (time.monotonic(), index)
+        return index
 
     # ------------------------------------------------------------------
     # Account state helpers
@@ -246,45 +358,36 @@ class HLClient:
     def get_positions(self, *, dex: str | None = None) -> List[Dict[str, Any]]:
         """Return positions for the selected dex (e.g. '', 'perp', 'spot')."""
         state = self._fetch_user_state(dex)
-        for key in (
-            "assetPositions",
-            "perpPositions",
-            "assetPositionsPerps",
-            "spotPositions",
-        ):
+        for key in _POSITION_KEYS:
             positions = state.get(key)
             if positions:
                 return positions  # type: ignore[return-value]
-        fallback = state.get("assetPositions")
-        if isinstance(fallback, list):
-            return fallback  # type: ignore[return-value]
+        # Every key was missing or empty.
         return []
 
     def get_balances(self, *, dex: str | None = None) -> Dict[str, Any]:
         """Return balance and margin information for the selected dex."""
         state = self._fetch_user_state(dex)
-        return {
-            "balances": state.get("balances") or [],
-            "marginSummary": state.get("marginSummary"),
-            "crossMarginSummary": state.get("crossMarginSummary"),
-            "crossMaintenanceMarginUsed": state.get("crossMaintenanceMarginUsed"),
-            "withdrawable": state.get("withdrawable"),
-            "time": state.get("time"),
-        }
+        result = {key: state.get(key) for key in _BALANCE_KEYS}
+        if not result["balances"]:
+            result["balances"] = []
+        return result
 
-    def get_open_orders(self) -> Iterable[Dict[str, Any]]:
-        return self.info.open_orders(ACCOUNT_ADDRESS)
+    def get_open_orders(self) -> List[Dict[str, Any]]:
+        orders = self.info.open_orders(ACCOUNT_ADDRESS)
+        return orders if isinstance(orders, list) else list(orders)
 
     # ------------------------------------------------------------------
     # Internals / utilities
     # ------------------------------------------------------------------
     @staticmethod
-    def _normalize_tif(tif: str) -> str:
-        tif_key = tif.strip().upper()
-        if tif_key not in TIF_ALIASES:
-            supported = ", ".join(TIF_ALIASES)
-            raise ValueError(f"Unsupported tif '{tif}'. Supported values: {supported}")
-        return TIF_ALIASES[tif_key]
+    def _normalize_side(side: str) -> str:
+        if side in _SIDES:
+            return side
+        side_norm = side.strip().lower()
+        if side_norm not in _SIDES:
+            raise ValueError("side must be 'buy' or 'sell'")
+        return side_norm
 
     @staticmethod
     def _resolve_base_url(network: str, override: Optional[str]) -> str:
@@ -317,24 +420,26 @@ class HLClient:
 
     @staticmethod
     def _coerce_price(raw: Any) -> float:
-        if isinstance(raw, (int, float)):
-            return float(raw)
-        if isinstance(raw, str):
+        # Exact-type checks first: the SDK almost always hands back a float.
+        raw_type = type(raw)
+        if raw_type is float or raw_type is int or raw_type is str:
             return float(raw)
-        if isinstance(raw, dict):
-            for key in ("markPrice", "mark_price", "price", "px"):
-                if key in raw:
-                    return float(raw[key])
-        if isinstance(raw, Iterable) and not isinstance(raw, (str, bytes)):
+        if raw_type is list or raw_type is tuple:
             for item in raw:
                 try:
                     return HLClient._coerce_price(item)
                 except (TypeError, ValueError):
                     continue
+        elif isinstance(raw, dict):  # dict and subclasses such as OrderedDict
+            for key in _PRICE_KEYS:
+                if key in raw:
+                    return float(raw[key])
+        elif isinstance(raw, (int, float, str)):
+            return float(raw)
         raise ValueError(f"Unexpected mark price payload: {raw!r}")
 
     def _fetch_user_state(self, dex: Optional[str]) -> Dict[str, Any]:
-        dex_value = (dex or "").strip()
+        dex_value = dex.strip() if dex else ""
         return self.info.user_state(ACCOUNT_ADDRESS, dex=dex_value)
 
     def _fallback_mark_price(self, symbol: str) -> Optional[float]:
@@ -348,11 +453,15 @@ class HLClient:
             return None
 
         symbol_key = symbol.upper()
-        containers: List[Any] = []
         if isinstance(meta, dict):
-            containers = [meta, meta.get("universe"), meta.get("markets"), meta.get("assets")]
+            containers: Tuple[Any, ...] = (
+                meta,
+                meta.get("universe"),
+                meta.get("markets"),
+                meta.get("assets"),
+            )
         else:
-            containers = [meta]
+            containers = (meta,)
 
         for container in containers:
             if isinstance(container, dict):
@@ -370,10 +479,9 @@ class HLClient:
     def _extract_from_container(entry: Any, symbol_key: str) -> Optional[float]:
         if not isinstance(entry, dict):
             return None
-        name_fields = ["symbol", "coin", "name", "ticker"]
-        for field in name_fields:
+        for field in _NAME_FIELDS:
             if field in entry and str(entry[field]).upper() == symbol_key:
-                for price_key in ("markPx", "mark_price", "markPrice", "px", "price"):
+                for price_key in _META_PRICE_KEYS:
                     if price_key in entry:
                         try:
                             return float(entry[price_key])
@@ -8,10 +8,13 @@ from dataclasses import dataclass
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
+# Constant 403 body, serialized once instead of per rejected request.
+_REJECT_BODY: bytes = b'{"error":"missing or invalid request header"}'
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class HeaderGuardConfig:
     """Configuration for validating an incoming HTTP header."""
 
@@ -29,13 +32,16 @@ class HeaderValidationMiddleware(BaseHTTPMiddleware):
 
     def __init__(self, app, guard: HeaderGuardConfig):
         super().__init__(app)
-        self._guard = guard
+        # Precomputed so dispatch does no per-request concatenation.
+        self._header_name: str = guard.name
+        self._expected: str = 'Bearer ' + guard.value
 
     async def dispatch(self, request: Request, call_next):
-        presented = request.headers.get(self._guard.name)
-        if presented != 'Bearer ' + self._guard.value:
-            return JSONResponse(
-                {"error": "missing or invalid request header"},
+        presented = request.headers.get(self._header_name)
+        if presented != self._expected:
+            return Response(
+                content=_REJECT_BODY,
                 status_code=403,
+                media_type="application/json",
             )
         return await call_next(request)
@@ -4,7 +4,7 @@ Revised to match the updated HLClient (market/limit helpers, symbol discovery, d
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import argparse
 import os
@@ -46,9 +46,18 @@ header_guard = (
 )
 
 server = GuardedFastMCP(name="hyperliquid-trader", header_guard=header_guard)
-hl = HLClient()
+_hl: HLClient | None = None
 
 TRANSPORT_CHOICES = ("stdio", "sse", "streamable-http")
+_DEFAULT_TRANSPORT = os.environ.get("MCP_TRANSPORT", "stdio")
+
+
+def _get_hl() -> HLClient:
+    """Build the shared HLClient on first tool call rather than at import."""
+    global _hl
+    if _hl is None:
+        _hl = HLClient()
+    return _hl
 
 
 # -----------------------------
@@ -58,7 +67,7 @@ TRANSPORT_CHOICES = ("stdio", "sse", "streamable-http")
 def get_mark_price(symbol: str) -> dict:
     """获取合约/币种的标记价格。"""
     try:
-        price = hl.get_mark_price(symbol)
+        price = _get_hl().get_mark_price(symbol)
         return {"ok": True, "symbol": symbol.upper(), "mark_price": price}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
@@ -68,7 +77,7 @@ def get_mark_price(symbol: str) -> dict:
 def list_symbols(limit: Optional[int] = 50) -> dict:
     """列出可交易的符号 (来自 mids)。默认返回前 50 个。"""
     try:
-        syms = hl.list_symbols(limit=limit)
+        syms = _get_hl().list_symbols(limit=limit)
         return {"ok": True, "count": len(syms), "symbols": syms}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
@@ -78,7 +87,7 @@ def list_symbols(limit: Optional[int] = 50) -> dict:
 def find_symbols(query: str, limit: int = 20) -> dict:
     """模糊搜索符号，返回 (symbol, mid_price)。"""
     try:
-        items = hl.find_symbols(query, limit=limit)
+        items = _get_hl().find_symbols(query, limit=limit)
         return {"ok": True, "matches": [{"symbol": s, "mid": px} for s, px in items]}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
@@ -98,7 +107,7 @@ def place_market(
 ) -> Dict[str, Any]:
     """市价单：side=buy/sell, qty=数量。支持 dry_run 与 reduce_only。"""
     try:
-        res = hl.place_market(symbol, side, float(qty), dry_run=dry_run, reduce_only=reduce_only)
+        res = _get_hl().place_market(symbol, side, float(qty), dry_run=dry_run, reduce_only=reduce_only)
         return {"ok": True, "result": res}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
@@ -117,7 +126,7 @@ def place_limit(
 ) -> Dict[str, Any]:
     """限价单：side=buy/sell, qty=数量, price=限价, tif=GTC/IOC/ALO。支持 dry_run 与 reduce_only。"""
     try:
-        res = hl.place_limit(
+        res = _get_hl().place_limit(
             symbol,
             side,
             float(qty),
@@ -140,7 +149,7 @@ def place_limit(
 # ) -> Dict[str, Any]:
 #     """现货市价单：side=buy/sell, qty=数量。支持 dry_run。"""
 #     try:
-#         res = hl.place_spot_market(symbol, side, float(qty), dry_run=dry_run)
+#         res = _get_hl().place_spot_market(symbol, side, float(qty), dry_run=dry_run)
 #         return {"ok": True, "result": res}
 #     except Exception as exc:  # noqa: BLE001
 #         return {"ok": False, "error": str(exc)}
@@ -158,7 +167,7 @@ def place_limit(
 # ) -> Dict[str, Any]:
 #     """现货限价单：side=buy/sell, qty=数量, price=限价, tif=GTC/IOC/ALO。支持 dry_run。"""
 #     try:
-#         res = hl.place_spot_limit(
+#         res = _get_hl().place_spot_limit(
 #             symbol,
 #             side,
 #             float(qty),
@@ -176,7 +185,7 @@ def place_limit(
 def cancel_order(order_id: str) -> dict:
     """撤单：order_id 来自下单返回或查询接口。"""
     try:
-        res = hl.cancel_order(order_id)
+        res = _get_hl().cancel_order(order_id)
         return {"ok": True, "result": res}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
@@ -186,7 +195,7 @@ def cancel_order(order_id: str) -> dict:
 def get_open_orders() -> dict:
     """查询当前所有未成交挂单。"""
     try:
-        return {"ok": True, "open_orders": list(hl.get_open_orders())}
+        return {"ok": True, "open_orders": _get_hl().get_open_orders()}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
 
@@ -195,7 +204,7 @@ def get_open_orders() -> dict:
 def get_positions(dex: Optional[str] = None) -> dict:
     """查询当前持仓，dex 可选：''（默认清算账户）、'perp'、'spot'。"""
     try:
-        positions = hl.get_positions(dex=dex)
+        positions = _get_hl().get_positions(dex=dex)
         return {"ok": True, "dex": (dex or ""), "positions": positions}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
@@ -205,7 +214,7 @@ def get_positions(dex: Optional[str] = None) -> dict:
 def get_balances(dex: Optional[str] = None) -> dict:
     """查询账户资金/权益，dex 可选：''（默认清算账户）、'perp'、'spot'。"""
     try:
-        balances = hl.get_balances(dex=dex)
+        balances = _get_hl().get_balances(dex=dex)
         return {"ok": True, "dex": (dex or ""), "balances": balances}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
@@ -217,11 +226,10 @@ def get_balances(dex: Optional[str] = None) -> dict:
 
 def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Hyperliquid MCP server")
-    default_transport = os.getenv("MCP_TRANSPORT", "stdio")
     parser.add_argument(
         "--transport",
         choices=TRANSPORT_CHOICES,
-        default=default_transport,
+        default=_DEFAULT_TRANSPORT,
         help="Transport protocol to use (default: stdio)",
     )
     parser.add_argument("--host", help="Host for SSE/HTTP transports (default: FASTMCP_HOST or 127.0.0.1)")
@@ -234,6 +242,28 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _announce_streamable_http(args: argparse.Namespace) -> None:
+    print(
+        f"Starting Streamable HTTP server on http://{server.settings.host}:{server.settings.port}"
+        f"{server.settings.streamable_http_path}",
+        file=sys.stderr,
+    )
+
+
+def _announce_sse(args: argparse.Namespace) -> None:
+    mount = args.mount_path or server.settings.mount_path
+    print(
+        f"Starting SSE server on http://{server.settings.host}:{server.settings.port}{mount}",
+        file=sys.stderr,
+    )
+
+
+_TRANSPORT_ANNOUNCERS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "streamable-http": _announce_streamable_http,
+    "sse": _announce_sse,
+}
+
+
 def main(argv: Optional[list[str]] = None) -> None:
     args = _parse_args(argv)
 
@@ -246,18 +276,9 @@ def main(argv: Optional[list[str]] = None) -> None:
     if args.streamable_http_path:
         server.settings.streamable_http_path = args.streamable_http_path
 
-    if args.transport == "streamable-http":
-        print(
-            f"Starting Streamable HTTP server on http://{server.settings.host}:{server.settings.port}"
-            f"{server.settings.streamable_http_path}",
-            file=sys.stderr,
-        )
-    elif args.transport == "sse":
-        mount = args.mount_path or server.settings.mount_path
-        print(
-            f"Starting SSE server on http://{server.settings.host}:{server.settings.port}{mount}",
-            file=sys.stderr,
-        )
+    announce = _TRANSPORT_ANNOUNCERS.get(args.transport)
+    if announce is not None:
+        announce(args)
 
     server.run(transport=args.transport, mount_path=args.mount_path)
 